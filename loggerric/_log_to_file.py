@@ -1,11 +1,57 @@
 from enum import Enum, auto
 from colorama import Fore
-import os, re
-import io
+import os
 import threading
-import queue
 import atexit
 import time
+from collections import deque
+from datetime import datetime
+from loggerric._timestamp import Timestamp
+
+# Bytes in the '@'..'~' range terminate a CSI escape sequence; precomputed so
+# the scan loop below does a single set lookup per character
+_CSI_TERMINATORS = frozenset(chr(c) for c in range(0x40, 0x7F))
+
+def _strip_ansi_fast(s:str) -> str:
+    """
+    Strip ANSI escape sequences with a plain `str.find` scan, which is much
+    cheaper than the regex engine for colorama's short `\\x1b[...m` runs.
+    Callers are expected to have checked for the ESC byte already.
+    """
+    parts = []
+    i = 0
+    find = s.find
+    length = len(s)
+    while True:
+        start = find('\x1b', i)
+        if start == -1:
+            parts.append(s[i:])
+            break
+        parts.append(s[i:start])
+
+        after = start + 1
+        if after < length and s[after] == '[':
+            # CSI sequence: parameter bytes, then intermediates, then a
+            # terminating byte from the precomputed set
+            j = after + 1
+            while j < length and '\x30' <= s[j] <= '\x3f':
+                j += 1
+            while j < length and '\x20' <= s[j] <= '\x2f':
+                j += 1
+            if j < length and s[j] in _CSI_TERMINATORS:
+                i = j + 1
+            else:
+                # Malformed/unterminated sequence, keep the ESC as-is
+                parts.append(s[start])
+                i = after
+        elif after < length and '\x40' <= s[after] <= '\x5f':
+            # Two-character escape (ESC + single byte)
+            i = after + 1
+        else:
+            # Bare ESC not starting a sequence, keep it as-is
+            parts.append(s[start])
+            i = after
+    return ''.join(parts)
 
 def escape_ansi(text:str) -> str:
     """
@@ -19,8 +65,14 @@ def escape_ansi(text:str) -> str:
     no_ansi = escape_ansi(text='myTextThatIncludesAnsi')
     ```
     """
-    regex = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return regex.sub('', text)
+    # Fast path: text without an ESC byte is returned untouched, without
+    # even entering the scanner (`in` on a str is a C-level memchr scan)
+    if '\x1b' not in text:
+        return text
+    return _strip_ansi_fast(text)
+
+# Maximum queued lines coalesced into a single write() by the writer thread
+_WRITER_BATCH = 256
 
 class LogToFileLevel(Enum):
     """
@@ -48,16 +100,40 @@ class LogToFile:
     }
 
     _should_dump = False
-    _dump_path = os.path.join(os.getenv('HOMEDRIVE'), os.getenv('HOMEPATH'),
+    _dump_path = os.path.join(os.path.expanduser('~'),
                               'loggerric_log_dump.log')
 
-    # Internal queue/writer for thread-safe writes
-    __writer_queue: "queue.Queue[str]" = queue.Queue()
+    # Internal queue/writer for thread-safe writes. A bounded deque plus an
+    # Event is a much lighter hand-off than queue.Queue (two lock round-trips
+    # per op): append/popleft are atomic under the GIL, and `maxlen` gives
+    # drop-oldest semantics under overload instead of unbounded growth.
+    # Dropped lines are counted in `_dropped_lines` (advisory, not exact).
+    # Tuple items carry a producer-captured time.time_ns() rendered at
+    # write time.
+    _writer_queue: "deque[str | tuple[str, int]]" = deque(maxlen=65536)
+    _writer_wake = threading.Event()
+    _dropped_lines: int = 0
+
+    # Diff reference for deferred timestamps: the datetime of the previous
+    # file line, shared by the writer thread and the synchronous fallback so
+    # the two T+ chains stay merged. Plain attribute updates (benign under
+    # the GIL), not mutual exclusion: the fallback only runs while the
+    # writer is stopped, so the paths never meaningfully race.
+    _last_deferred_ts: datetime | None = None
     _writer_thread: threading.Thread | None = None
     _writer_running: bool = False
-    _writer_file: io.TextIOBase | None = None
+    _writer_fd: int | None = None
     _writer_lock = threading.Lock()
 
+    # Lazily opened descriptor reused by the synchronous fallback in _log,
+    # guarded by _writer_lock; one open/close pair instead of one per line
+    _fallback_fd: int | None = None
+
+    # Serializes start/stop of the writer thread; separate from _writer_lock
+    # so stopping never contends with the synchronous write fallback
+    _state_lock = threading.Lock()
+    _atexit_registered: bool = False
+
     @classmethod
     def set_dump_location(cls, full_directory:str, file_name:str) -> None:
         """
@@ -76,9 +152,12 @@ class LogToFile:
         """
         path_exists = os.path.exists(full_directory)
         assert path_exists, f'Directory "{full_directory}" does not exist!'
-        
+
         cls._dump_path = os.path.join(full_directory, file_name + '.log')
 
+        # The cached fallback descriptor points at the old path, drop it
+        cls._close_fallback_fd()
+
     @classmethod
     def start_logging(cls) -> None:
         """
@@ -133,114 +212,187 @@ class LogToFile:
         cls._active_levels.difference_update(levels)
 
     @classmethod
-    def _log(cls, data:str) -> None:
+    def is_level_active(cls, level:LogToFileLevel) -> bool:
         """
-        Enqueue data to background writer. If background writer is not
-        available, fall back to direct append with a lock.
+        **Check whether a level would currently be written to file.**
+
+        Combines the dump and active-level checks into one call so hot
+        logging paths pay a single attribute lookup.
+
+        *Parameters*:
+        - `level` (LogToFileLevel): The level to check.
+
+        *Example*:
+        ```python
+        if LogToFile.is_level_active(LogToFileLevel.INFO):
+            ...
+        ```
         """
-        if not data:
-            return
+        return cls._should_dump and level in cls._active_levels
 
-        line = str(data) + '\n'
+    @classmethod
+    def _log(cls, line:str, t_ns:int|None=None) -> None:
+        """
+        Enqueue a line (without trailing newline) to the background writer;
+        the newline is appended at write time. When `t_ns` (time.time_ns()
+        captured by the caller) is given, the timestamp prefix is rendered
+        by the writer thread instead of on the hot logging path. If the
+        background writer is not available, fall back to direct append with
+        a lock.
+        """
+        if not line:
+            return
 
-        # If writer running, enqueue
+        # If writer running, enqueue and wake it. When the bounded queue is
+        # full the oldest line is dropped rather than blocking the caller.
         if cls._writer_running:
-            try:
-                cls._writer_queue.put_nowait(line)
-                return
-            except queue.Full:
-                # Fall through to synchronous write if queue is full
-                pass
+            q = cls._writer_queue
+            if len(q) == q.maxlen:
+                cls._dropped_lines += 1
+            q.append(line if t_ns is None else (line, t_ns))
+            cls._writer_wake.set()
+            return
 
-        # Fallback synchronous write protected by lock
+        # Fallback synchronous write protected by lock, reusing a lazily
+        # opened descriptor instead of an open/close pair per line
         with cls._writer_lock:
-            with open(cls._dump_path, 'a+t', encoding='utf-8') as file:
-                file.write(line)
+            if t_ns is not None:
+                ts_dt = datetime.fromtimestamp(t_ns / 1_000_000_000)
+                ts = Timestamp._render(ts_dt, cls._last_deferred_ts)
+                cls._last_deferred_ts = ts_dt
+                line = f'[{ts}] {line}'
+            if cls._fallback_fd is None:
+                cls._fallback_fd = os.open(cls._dump_path,
+                                           os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                                           0o644)
+            os.write(cls._fallback_fd, (line + '\n').encode('utf-8'))
+
+    @classmethod
+    def _close_fallback_fd(cls) -> None:
+        """Close the cached synchronous-fallback descriptor, if open."""
+        with cls._writer_lock:
+            if cls._fallback_fd is not None:
+                try:
+                    os.close(cls._fallback_fd)
+                except Exception:
+                    pass
+                cls._fallback_fd = None
 
     @classmethod
     def _start_writer(cls) -> None:
         """Start the background writer thread. Safe to call multiple times."""
-        if cls._writer_running:
-            return
+        with cls._state_lock:
+            if cls._writer_running:
+                return
+
+            # Ensure directory exists for path
+            parent = os.path.dirname(cls._dump_path)
+            if parent and not os.path.exists(parent):
+                try:
+                    os.makedirs(parent, exist_ok=True)
+                except Exception:
+                    pass
 
-        # Ensure directory exists for path
-        parent = os.path.dirname(cls._dump_path)
-        if parent and not os.path.exists(parent):
+            # Open a raw O_APPEND descriptor once: os.write on it is a single
+            # syscall with no Python-level buffer or lock in front of it
             try:
-                os.makedirs(parent, exist_ok=True)
+                cls._writer_fd = os.open(cls._dump_path,
+                                         os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                                         0o644)
             except Exception:
-                pass
+                cls._writer_fd = None
 
-        # Open file handle once for append
-        try:
-            cls._writer_file = open(cls._dump_path, 'a+t', encoding='utf-8')
-        except Exception:
-            cls._writer_file = None
+            cls._writer_running = True
 
-        cls._writer_running = True
-
-        def _writer_loop():
-            while cls._writer_running or not cls._writer_queue.empty():
-                try:
+            def _writer_loop():
+                q = cls._writer_queue
+                buf = bytearray()
+                while cls._writer_running or q:
                     try:
-                        item = cls._writer_queue.get(timeout=0.2)
-                    except queue.Empty:
-                        continue
-
-                    if item is None:
-                        # Sentinel for immediate shutdown
-                        break
-
-                    if cls._writer_file is not None:
-                        try:
-                            cls._writer_file.write(item)
-                            cls._writer_file.flush()
-                        except Exception:
-                            # On write error, ignore to avoid crashing the thread
-                            pass
-                    else:
-                        # If file handle could not be opened, try direct append
-                        with cls._writer_lock:
-                            with open(cls._dump_path, 'a+t', encoding='utf-8') as f:
-                                f.write(item)
-
-                    cls._writer_queue.task_done()
-                except Exception:
-                    # Catch-all to keep the loop alive
-                    time.sleep(0.1)
-
-            # Close file handle
-            if cls._writer_file is not None:
-                try:
-                    cls._writer_file.close()
-                except Exception:
-                    pass
-                cls._writer_file = None
+                        if not q:
+                            # Block until a producer signals new work (or
+                            # _stop_writer wakes us to shut down); no idle polling
+                            cls._writer_wake.wait()
+                            cls._writer_wake.clear()
+                            continue
+
+                        # Drain everything available (up to the batch cap) so a
+                        # burst of lines costs one write() instead of one each
+                        batch = []
+                        while len(batch) < _WRITER_BATCH and q:
+                            try:
+                                batch.append(q.popleft())
+                            except IndexError:
+                                # Raced with drop-oldest on overflow
+                                break
+                        if not batch:
+                            continue
+
+                        # Encode the batch into the reusable accumulator (lines
+                        # are queued without their newline, added here); the
+                        # unbuffered write then hits the kernel in one call.
+                        # Tuple items carry a producer-captured time_ns whose
+                        # timestamp prefix is rendered here, off the hot path.
+                        for item in batch:
+                            if type(item) is tuple:
+                                text, t_ns = item
+                                ts_dt = datetime.fromtimestamp(t_ns / 1_000_000_000)
+                                ts = Timestamp._render(ts_dt, cls._last_deferred_ts)
+                                cls._last_deferred_ts = ts_dt
+                                item = f'[{ts}] {text}'
+                            buf.extend(item.encode('utf-8'))
+                            buf.append(0x0a)
+
+                        if cls._writer_fd is not None:
+                            try:
+                                os.write(cls._writer_fd, buf)
+                            except Exception:
+                                # On write error, ignore to avoid crashing the thread
+                                pass
+                        else:
+                            # If the descriptor could not be opened, try direct append
+                            with cls._writer_lock:
+                                with open(cls._dump_path, 'ab') as f:
+                                    f.write(buf)
+                        buf.clear()
+                    except Exception:
+                        # Catch-all to keep the loop alive
+                        time.sleep(0.1)
+
+                # Close the descriptor (writes are unbuffered, nothing to flush)
+                if cls._writer_fd is not None:
+                    try:
+                        os.close(cls._writer_fd)
+                    except Exception:
+                        pass
+                    cls._writer_fd = None
 
-        cls._writer_thread = threading.Thread(target=_writer_loop, daemon=True, name='loggerric-file-writer')
-        cls._writer_thread.start()
+            cls._writer_thread = threading.Thread(target=_writer_loop, daemon=True, name='loggerric-file-writer')
+            cls._writer_thread.start()
 
-        # Ensure clean shutdown
-        atexit.register(cls._stop_writer)
+            # Ensure clean shutdown, registered at most once
+            if not cls._atexit_registered:
+                atexit.register(cls._stop_writer)
+                cls._atexit_registered = True
 
     @classmethod
     def _stop_writer(cls, timeout:float=2.0) -> None:
         """Stop the writer thread and flush pending items."""
-        if not cls._writer_running:
-            return
+        with cls._state_lock:
+            cls._close_fallback_fd()
+
+            if not cls._writer_running:
+                return
 
-        cls._writer_running = False
+            cls._writer_running = False
 
-        # Put sentinel to unblock queue.get if needed
-        try:
-            cls._writer_queue.put_nowait(None)
-        except Exception:
-            pass
+            # Wake the writer so it can drain and exit
+            cls._writer_wake.set()
 
-        # Wait for thread to finish
-        t = cls._writer_thread
-        if t is not None and t.is_alive():
-            t.join(timeout)
+            # Wait for thread to finish
+            t = cls._writer_thread
+            if t is not None and t.is_alive():
+                t.join(timeout)
 
-        # If still alive, we leave it (daemon thread)
-        cls._writer_thread = None
\ No newline at end of file
+            # If still alive, we leave it (daemon thread)
+            cls._writer_thread = None
\ No newline at end of file
@@ -1,17 +1,48 @@
 from __future__ import annotations
 
+import sys
 import threading
+import time
 from enum import Enum, auto
 from typing import Optional, Set
 from colorama import Fore
 from loggerric._timestamp import Timestamp
-from loggerric._log_to_file import LogToFile, LogToFileLevel, escape_ansi
+from loggerric._log_to_file import LogToFile, LogToFileLevel
 
 
 # Module-level lock used by all Logger instances to avoid interleaved prints
 _print_lock = threading.Lock()
 
 
+# Writing raw bytes to the buffer beneath colorama's wrapper is only
+# output-equivalent when the wrapper neither strips nor converts ANSI
+# (autoreset's trailing reset is redundant: every logger line already ends
+# with Fore.RESET). Resolved lazily and cached per stdout object, since
+# colorama.init() swaps sys.stdout after this module is imported.
+_fast_cache: "tuple[object, object]" = (None, None)
+
+
+def _stdout_fast_buffer():
+    global _fast_cache
+    stdout = sys.stdout
+    cached_stream, cached_buffer = _fast_cache
+    if stdout is cached_stream:
+        return cached_buffer
+
+    stream = stdout
+    if type(stream).__module__.startswith('colorama'):
+        convertor = getattr(stream, '_StreamWrapper__convertor', None)
+        if convertor is None or convertor.strip or convertor.convert:
+            # The wrapper rewrites output; bypassing it would change what
+            # reaches the console
+            stream = None
+        else:
+            stream = convertor.wrapped
+    buffer = getattr(stream, 'buffer', None) if stream is not None else None
+    _fast_cache = (stdout, buffer)
+    return buffer
+
+
 class Level(Enum):
     INFO = auto()
     WARN = auto()
@@ -19,11 +50,18 @@ class Level(Enum):
     DEBUG = auto()
 
 
+# Maps Level to LogToFileLevel, indexed by `Level.value` (auto() starts at 1)
+# so the lookup is plain tuple indexing instead of dict hashing
+_LTF_BY_LEVEL = (None, LogToFileLevel.INFO, LogToFileLevel.WARN,
+                 LogToFileLevel.ERROR, LogToFileLevel.DEBUG)
+
+
 class ThreadSafeLogger:
     """A simple thread-safe logger for console printing (and optional file logging).
 
-    - All instances share an internal print lock so printed lines are not
-      interleaved when called from multiple threads.
+    - Each line is emitted as one binary write where stdout allows it (a
+      shared print lock covers the remaining streams), so lines from
+      multiple threads are not interleaved.
     - Each instance has its own enabled log level set, so you can create
       multiple loggers with different verbosity.
     - Optionally forwards messages to `LogToFile` (uses package's file writer).
@@ -35,6 +73,17 @@ class ThreadSafeLogger:
         self._enabled_levels: Set[Level] = enabled_levels or {Level.INFO, Level.WARN, Level.ERROR, Level.DEBUG}
         self._forward_to_file = forward_to_file
 
+        # Per-level prefixes precomputed once so each log call composes a
+        # single f-string instead of re-reading Fore attributes and paying a
+        # formatting call frame
+        name_part = f'[{name}] '
+        self._prefix_info = f'{Fore.GREEN}[i] {name_part}'
+        self._prefix_warn = f'{Fore.YELLOW}[w] {name_part}'
+        self._prefix_error = f'{Fore.RED}[!] {name_part}'
+        self._prefix_debug = f'{Fore.LIGHTBLACK_EX}[?] {name_part}'
+        self._plain_name = name_part
+        self._reset = Fore.RESET
+
     # Level management
     def enable(self, *levels: Level) -> None:
         self._enabled_levels.update(levels)
@@ -50,72 +99,89 @@ class ThreadSafeLogger:
         return level in self._enabled_levels
 
     # Internal formatting
-    def _format(self, level_tag: str, color: str, message: str) -> str:
-        ts = ''
+    def _ts(self) -> str:
         try:
-            ts = Timestamp.get(return_with_ansi=True)
+            return Timestamp.get(return_with_ansi=True)
         except Exception:
-            ts = ''
-        name_part = f'[{self.name}] '
-        return f'{ts}{color}{level_tag} {name_part}{message}{Fore.RESET}'
+            return ''
 
     def _print(self, text: str) -> None:
-        # Acquire the module-level lock so entire print is atomic
+        # A whole line in one buffer.write is serialized by the
+        # BufferedWriter's own internal lock, so lines cannot interleave
+        # and the shared print lock is skipped entirely
+        buffer = _stdout_fast_buffer()
+        if buffer is not None:
+            try:
+                buffer.write((text + '\n').encode('utf-8'))
+                # The binary buffer is block-buffered even on a tty (line
+                # buffering lives in the TextIOWrapper above it), so flush
+                # to keep every line immediately visible
+                buffer.flush()
+                return
+            except (ValueError, OSError):
+                # Closed or unusual stream, fall back to locked print
+                pass
+
+        # Rewriting (strip/convert) colorama wrappers and non-binary
+        # stdouts take the locked print path
         with _print_lock:
             print(text, flush=True)
 
-    def _maybe_forward_file(self, text_with_ansi: str, level: Level) -> None:
+    def _maybe_forward_file(self, raw: str, level_tag: str, level: Level) -> None:
+        # Check the cheap booleans before formatting anything
         if not self._forward_to_file:
             return
 
-        # Map Level to LogToFileLevel conservatively
-        mapping = {
-            Level.INFO: LogToFileLevel.INFO,
-            Level.WARN: LogToFileLevel.WARN,
-            Level.ERROR: LogToFileLevel.ERROR,
-            Level.DEBUG: LogToFileLevel.DEBUG,
-        }
-        ltf_level = mapping.get(level, LogToFileLevel.INFO)
-        if ltf_level in LogToFile._active_levels and LogToFile._should_dump:
-            # Use escape_ansi then forward to global writer
-            LogToFile._log(escape_ansi(text_with_ansi))
+        if LogToFile.is_level_active(_LTF_BY_LEVEL[level.value]):
+            # Capture the time cheaply here; the writer thread renders the
+            # timestamp prefix so the producer only pays a time_ns() call
+            t_ns = time.time_ns() if Timestamp._enabled else None
+            LogToFile._log(f'{level_tag} {self._plain_name}{raw}', t_ns)
 
     # Public logging methods
     def info(self, *parts: object) -> None:
         if not self.is_enabled(Level.INFO):
             return
-        raw = ' '.join(str(p) for p in parts)
-        formatted = self._format('[i]', Fore.GREEN, raw)
-        self._print(formatted)
-        self._maybe_forward_file(formatted, Level.INFO)
+        if len(parts) == 1 and type(parts[0]) is str:
+            raw = parts[0]
+        else:
+            raw = ' '.join(map(str, parts))
+        self._print(f'{self._ts()}{self._prefix_info}{raw}{self._reset}')
+        self._maybe_forward_file(raw, '[i]', Level.INFO)
 
     def warn(self, *parts: object) -> None:
         if not self.is_enabled(Level.WARN):
             return
-        raw = ' '.join(str(p) for p in parts)
-        formatted = self._format('[w]', Fore.YELLOW, raw)
-        self._print(formatted)
-        self._maybe_forward_file(formatted, Level.WARN)
+        if len(parts) == 1 and type(parts[0]) is str:
+            raw = parts[0]
+        else:
+            raw = ' '.join(map(str, parts))
+        self._print(f'{self._ts()}{self._prefix_warn}{raw}{self._reset}')
+        self._maybe_forward_file(raw, '[w]', Level.WARN)
 
     def error(self, *parts: object, quit_after: bool = False) -> None:
         if not self.is_enabled(Level.ERROR):
             if quit_after:
                 exit(1)
             return
-        raw = ' '.join(str(p) for p in parts)
-        formatted = self._format('[!]', Fore.RED, raw)
-        self._print(formatted)
-        self._maybe_forward_file(formatted, Level.ERROR)
+        if len(parts) == 1 and type(parts[0]) is str:
+            raw = parts[0]
+        else:
+            raw = ' '.join(map(str, parts))
+        self._print(f'{self._ts()}{self._prefix_error}{raw}{self._reset}')
+        self._maybe_forward_file(raw, '[!]', Level.ERROR)
         if quit_after:
             exit(1)
 
     def debug(self, *parts: object) -> None:
         if not self.is_enabled(Level.DEBUG):
             return
-        raw = ' '.join(str(p) for p in parts)
-        formatted = self._format('[?]', Fore.LIGHTBLACK_EX, raw)
-        self._print(formatted)
-        self._maybe_forward_file(formatted, Level.DEBUG)
+        if len(parts) == 1 and type(parts[0]) is str:
+            raw = parts[0]
+        else:
+            raw = ' '.join(map(str, parts))
+        self._print(f'{self._ts()}{self._prefix_debug}{raw}{self._reset}')
+        self._maybe_forward_file(raw, '[?]', Level.DEBUG)
 
 
 # Convenience: a simple registry/factory
@@ -126,9 +192,9 @@ def get_logger(name: str = 'root', *, forward_to_file: bool = False) -> ThreadSa
     """Return a (cached) logger instance by name."""
     if name in _loggers:
         return _loggers[name]
-    logger = ThreadSafeLogger(name, forward_to_file=forward_to_file)
-    _loggers[name] = logger
-    return logger
+    # setdefault is atomic under the GIL, so two threads racing the first
+    # call for a name always end up sharing the same instance
+    return _loggers.setdefault(name, ThreadSafeLogger(name, forward_to_file=forward_to_file))
 
 
 # Default root logger instance
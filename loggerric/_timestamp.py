@@ -28,19 +28,39 @@ class Timestamp:
         ```
         """
         # Check if a timestamp should be returned
-        if not cls._enabled and return_with_ansi:                              
+        if not cls._enabled and return_with_ansi:
             return ''
 
         # Grab the current time
         now = datetime.now()
 
+        # Format timestamp
+        timestamp = cls._render(now, cls._last_get)
+
+        # Check if the difference reference should be set
+        if not dont_override_diff:
+            cls._last_get = now
+
+        # Return the timestamp
+        if return_with_ansi:
+            return f'{Fore.MAGENTA}[{timestamp}] {Fore.RESET}'
+        else:
+            return timestamp
+
+    @classmethod
+    def _render(cls, now:datetime, last) -> str:
+        """
+        Format `now` with the configured format, diffed against `last`.
+        Split out of `get()` so deferred consumers (e.g. the file-writer
+        thread) can render a timestamp captured earlier on the hot path.
+        """
         # Extract difference components
-        if cls._last_get is None:
+        if last is None:
             dh = dm = ds = dn = 0
         else:
-            diff = now - cls._last_get
+            diff = now - last
             total_seconds = diff.total_seconds()
-            dh, remainder = divmod(total_seconds, 3600)                        
+            dh, remainder = divmod(total_seconds, 3600)
             dm, ds = divmod(remainder, 60)
             dn = diff.microseconds // 1000
 
@@ -60,7 +80,7 @@ class Timestamp:
         }
 
         # If this is the first message, set diff to 0
-        if cls._last_get == 0 or isinstance(cls._last_get, int):
+        if last == 0 or isinstance(last, int):
             lookup['{DH}'] = '00'
             lookup['{DM}'] = '00'
             lookup['{DS}'] = '00'
@@ -71,16 +91,8 @@ class Timestamp:
         for k, v in lookup.items():
             timestamp = timestamp.replace(k, v)
 
-        # Check if the difference reference should be set
-        if not dont_override_diff:
-            cls._last_get = now
+        return timestamp
 
-        # Return the timestamp
-        if return_with_ansi:
-            return f'{Fore.MAGENTA}[{timestamp}] {Fore.RESET}'
-        else:
-            return timestamp
-    
     @classmethod
     def set_format(cls, format:str) -> None:
         """